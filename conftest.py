@@ -50,6 +50,25 @@ def use_requests_cache(request):
         start_caching(hours)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def manubot_cache_directory(tmp_path_factory):
+    """
+    Set XDG_CACHE_HOME to a temporary directory for the test session,
+    such that tests do not read or write the user's Manubot cache
+    (see `manubot.util.get_cache_directory`).
+    This includes manubot commands that tests invoke as subprocesses.
+    """
+    import os
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("xdg-cache"))
+    yield
+    if xdg_cache_home is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = xdg_cache_home
+
+
 def cache_path():
     from pathlib import Path
 
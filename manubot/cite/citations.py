@@ -1,11 +1,12 @@
+import concurrent.futures
 import dataclasses
-import json
 import logging
 import os
 import pathlib
 import typing as tp
 
 from manubot.cite.citekey import CiteKey, citekey_to_csl_item
+from manubot.util import serialize_json
 
 
 @dataclasses.dataclass
@@ -31,6 +32,9 @@ class Citations:
     # `sort_csl_items=False` retains order of input_ids in get_csl_items.
     # (input_ids with the same standard_id will still be deduplicated).
     sort_csl_items: bool = True
+    # maximum number of threads for generating CSL Items concurrently,
+    # which speeds up retrieving metadata from web APIs for many citekeys.
+    max_workers: int = 10
 
     def __post_init__(self):
         input_ids = list(dict.fromkeys(self.input_ids))  # deduplicate
@@ -147,15 +151,22 @@ class Citations:
         # excludes standard_ids for which CSL Items could not be generated.
         self.input_to_csl_id = {}
         self.csl_items = []
-        for _standard_id, citekeys in self.group_citekeys_by(
-            "standard_id", sort=self.sort_csl_items
-        ):
-            csl_item = citekey_to_csl_item(
-                citekey=citekeys[0],
+        groups = self.group_citekeys_by("standard_id", sort=self.sort_csl_items)
+
+        def get_csl_item(citekey):
+            return citekey_to_csl_item(
+                citekey=citekey,
                 prune=self.prune_csl_items,
                 log_level=self.csl_item_failure_log_level,
                 manual_refs=self.manual_refs,
             )
+
+        # executor.map returns results in the order of groups
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            csl_items = list(
+                executor.map(get_csl_item, (citekeys[0] for _, citekeys in groups))
+            )
+        for (_standard_id, citekeys), csl_item in zip(groups, csl_items):
             if csl_item:
                 for ck in citekeys:
                     self.input_to_csl_id[ck.input_id] = csl_item["id"]
@@ -179,7 +190,7 @@ class Citations:
     @property
     def csl_json(self) -> str:
         assert hasattr(self, "csl_items")
-        json_str = json.dumps(self.csl_items, indent=2, ensure_ascii=False)
+        json_str = serialize_json(self.csl_items).decode()
         json_str += "\n"
         return json_str
 
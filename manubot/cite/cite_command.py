@@ -1,25 +1,27 @@
 import argparse
-import json
 import logging
 import pathlib
 import subprocess
 import sys
+import types
 
 from manubot.cite.citations import Citations
 from manubot.pandoc.util import get_pandoc_info
-from manubot.util import shlex_join
+from manubot.util import serialize_json, shlex_join
 
 # For manubot cite, infer --format from --output filename extensions
-extension_to_format = {
-    ".json": "csljson",
-    ".yaml": "cslyaml",
-    ".yml": "cslyaml",
-    ".txt": "plain",
-    ".md": "markdown",
-    ".docx": "docx",
-    ".html": "html",
-    ".xml": "jats",
-}
+extension_to_format = types.MappingProxyType(
+    {
+        ".json": "csljson",
+        ".yaml": "cslyaml",
+        ".yml": "cslyaml",
+        ".txt": "plain",
+        ".md": "markdown",
+        ".docx": "docx",
+        ".html": "html",
+        ".xml": "jats",
+    }
+)
 
 
 def call_pandoc(metadata, path, format="plain"):
@@ -29,9 +31,6 @@ def call_pandoc(metadata, path, format="plain"):
     _exit_without_pandoc()
     info = get_pandoc_info()
     _check_pandoc_version(info, metadata, format)
-    metadata_block = "---\n{yaml}\n...\n".format(
-        yaml=json.dumps(metadata, ensure_ascii=False, indent=2)
-    )
     args = [
         "pandoc",
         "--citeproc"
@@ -60,11 +59,42 @@ def call_pandoc(metadata, path, format="plain"):
             assert filter_path.exists()
             args.append(f"--lua-filter={filter_path}")
     logging.info("call_pandoc subprocess args:\n" + shlex_join(args))
-    process = subprocess.run(
-        args=args,
-        input=metadata_block.encode(),
-    )
-    process.check_returncode()
+    with subprocess.Popen(args, stdin=subprocess.PIPE) as process:
+        try:
+            for chunk in _iter_metadata_block(metadata):
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            # pandoc exited before reading all input. Its returncode reports why.
+            pass
+        except BaseException:
+            # kill pandoc rather than let it render a truncated metadata block
+            process.kill()
+            raise
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args)
+
+
+def _iter_metadata_block(metadata: dict):
+    """
+    Generate a YAML metadata block for Pandoc as chunks of bytes, such that the
+    entire block does not need to be held in memory. Values are serialized as JSON,
+    which is valid YAML. Lists are output with one chunk per item.
+    """
+    yield b"---\n"
+    for key, value in metadata.items():
+        key = serialize_json(key, indent=False)
+        if isinstance(value, list) and value:
+            yield key + b":\n"
+            for item in value:
+                yield b"- " + serialize_json(item, indent=False) + b"\n"
+        else:
+            yield key + b": " + serialize_json(value, indent=False) + b"\n"
+    yield b"...\n"
 
 
 def _parse_cli_cite_args(args: argparse.Namespace):
@@ -3,10 +3,15 @@ Utilities for representing and processing citation keys.
 """
 import dataclasses
 import functools
+import hashlib
 import logging
 import re
 import typing as tp
 
+import base62
+
+from manubot import __version__ as manubot_version
+
 try:
     from functools import cached_property
 except ImportError:
@@ -52,9 +57,9 @@ class CiteKey:
     def _set_prefix_accession(self) -> None:
         self._prefix = None
         self._accession = None
-        split_id = self.dealiased_id.split(":", 1)
-        if len(split_id) == 2:
-            self._prefix, self._accession = split_id
+        prefix, sep, accession = self.dealiased_id.partition(":")
+        if sep:
+            self._prefix, self._accession = prefix, accession
         if self.infer_prefix and not self.is_known_prefix:
             self._infer_prefix()
 
@@ -145,8 +150,17 @@ class CiteKey:
         Inspect citekey for potential problems.
         If no problems are found, return None.
         Otherwise, returns a string describing the problem.
+        The result is cached, since CiteKeys from `from_input_id` are
+        shared by repeated citations of the same input_id.
+        Citekeys without a handled prefix have nothing to inspect,
+        so they are passed without instantiating a handler.
         """
-        return self.handler.inspect(self)
+        if not hasattr(self, "_inspection"):
+            if not self.is_handled_prefix:
+                self._inspection = None
+            else:
+                self._inspection = self.handler.inspect(self)
+        return self._inspection
 
     def _standardize(self) -> None:
         """
@@ -227,6 +241,7 @@ class CiteKey:
         return False
 
 
+@functools.lru_cache(maxsize=5_000)
 def shorten_citekey(standard_citekey: str) -> str:
     """
     Return a shortened citekey derived from the input citekey.
@@ -236,10 +251,6 @@ def shorten_citekey(standard_citekey: str) -> str:
     and then converting this digest to a base62 ASCII str. Shortened
     citekeys consist of characters in the following ranges: 0-9, a-z and A-Z.
     """
-    import hashlib
-
-    import base62
-
     assert not standard_citekey.startswith("@")
     as_bytes = standard_citekey.encode()
     blake_hash = hashlib.blake2b(as_bytes, digest_size=6)
@@ -254,8 +265,6 @@ def citekey_to_csl_item(
     """
     Generate a CSL_Item for the input citekey.
     """
-    from manubot import __version__ as manubot_version
-
     # https://stackoverflow.com/a/35704430/4651668
     log_level = logging._checkLevel(log_level)
     if not isinstance(citekey, CiteKey):
@@ -8,11 +8,101 @@ Citation Style Language (CSL) styles.
 """
 import copy
 import functools
+import itertools
+import json
 import logging
+import threading
 
-from manubot.util import read_serialized_data
+from manubot.util import get_cache_directory, read_serialized_data
 
+"""
+Lock held while building the CSL schema and validators. functools.lru_cache
+does not stop concurrent threads, such as those of Citations.get_csl_items,
+from each downloading the schema and compiling the validators on a cold cache.
+"""
+_csl_schema_lock = threading.RLock()
+
+
+def _locked(function):
+    """
+    Decorator to call function while holding _csl_schema_lock.
+    Apply above functools.lru_cache, such that concurrent calls on a cold cache
+    wait for the first call to populate the cache rather than repeat it.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with _csl_schema_lock:
+            return function(*args, **kwargs)
 
+    return wrapper
+
+
+@_locked
+@functools.lru_cache()
+def get_csl_schema() -> dict:
+    """
+    Return the CSL Item JSON Schema
+    """
+    url = "https://github.com/dhimmel/csl-schema/raw/manubot/csl-data.json"
+    return _read_cached_schema(url)
+
+
+"""
+Maximum age in seconds of a cached schema before it is downloaded again,
+such that updates to schemas on a branch reach users.
+"""
+_schema_cache_max_age: float = 3 * 24 * 60 * 60
+
+
+def _read_cached_schema(url: str) -> dict:
+    """
+    Read the JSON Schema at url. Downloaded schemas are cached on disk in the
+    Manubot cache directory, such that later invocations read the schema from
+    the cache rather than the network. The schema's $refs are internal
+    (relative to the document root), so the cached document is sufficient
+    to validate without further network requests.
+    Cached schemas older than _schema_cache_max_age are downloaded again.
+    If the download fails, the stale cached schema is used instead,
+    such that offline invocations still work.
+    Unreadable cache files are ignored. When there is no cache directory,
+    the schema is always downloaded.
+    """
+    import hashlib
+    import time
+
+    cache_directory = get_cache_directory()
+    if cache_directory is None:
+        return read_serialized_data(url)
+    name = hashlib.sha256(url.encode()).hexdigest()
+    path = cache_directory.joinpath("schemas", f"{name}.json")
+    try:
+        age = time.time() - path.stat().st_mtime
+        cached_schema = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached_schema = None
+    else:
+        if age < _schema_cache_max_age:
+            return cached_schema
+    try:
+        schema = read_serialized_data(url)
+    except Exception as error:
+        if cached_schema is None:
+            raise
+        logging.warning(
+            f"_read_cached_schema: could not download {url}. "
+            f"Using the outdated cached schema at {path} instead.\n{error}"
+        )
+        return cached_schema
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema, indent=2), encoding="utf-8")
+    except OSError as error:
+        logging.info(f"_read_cached_schema: could not write {path}:\n{error}")
+    return schema
+
+
+@_locked
 @functools.lru_cache()
 def get_jsonschema_csl_validator():
     """
@@ -20,86 +110,137 @@ def get_jsonschema_csl_validator():
     """
     import jsonschema
 
-    url = "https://github.com/dhimmel/csl-schema/raw/manubot/csl-data.json"
-    schema = read_serialized_data(url)
+    schema = _inline_local_refs(get_csl_schema())
     Validator = jsonschema.validators.validator_for(schema)
     Validator.check_schema(schema)
     return Validator(schema)
 
 
+def _inline_local_refs(schema: dict) -> dict:
+    """
+    Return a copy of a JSON Schema where subschemas consisting of only a local
+    reference, like {"$ref": "#/definitions/date-variable"}, are replaced by the
+    referenced subschema. Referenced subschemas are resolved once and shared,
+    such that validators do not resolve the references on every validation.
+    Recursive references are left as is.
+    """
+    inlined = dict()
+
+    def inline(node, active_refs):
+        if isinstance(node, list):
+            return [inline(value, active_refs) for value in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if len(node) != 1 or not isinstance(ref, str) or not ref.startswith("#/"):
+            return {key: inline(value, active_refs) for key, value in node.items()}
+        if ref in active_refs:
+            return node
+        if ref not in inlined:
+            path = [
+                part.replace("~1", "/").replace("~0", "~")
+                for part in ref[2:].split("/")
+            ]
+            inlined[ref] = inline(_deep_get(schema, path), active_refs | {ref})
+        return inlined[ref]
+
+    return inline(schema, frozenset())
+
+
+@_locked
+@functools.lru_cache()
+def get_fastjsonschema_csl_validator():
+    """
+    Return a fastjsonschema validation function for the CSL Item JSON Schema.
+    fastjsonschema generates Python code specialized to the schema,
+    which checks valid instances much faster than the jsonschema validator.
+    However, it stops at the first error, so use get_jsonschema_csl_validator
+    when errors must be enumerated.
+    """
+    import fastjsonschema
+
+    return fastjsonschema.compile(get_csl_schema(), use_default=False)
+
+
+def is_valid_csl(instance) -> bool:
+    """
+    Return whether instance (CSL JSON) validates against the CSL Item JSON Schema.
+    """
+    from fastjsonschema import JsonSchemaException
+
+    validate = get_fastjsonschema_csl_validator()
+    try:
+        validate(instance)
+    except JsonSchemaException:
+        return False
+    return True
+
+
+"""
+Maximum number of JSON Schema errors that remove_jsonschema_errors collects
+per pass, to bound time and memory for pathological instances.
+"""
+_max_jsonschema_errors: int = 1000
+
+
 def remove_jsonschema_errors(instance, recurse_depth=5, in_place=False):
     """
-    Remove fields in CSL Items that produce JSON Schema errors. Should errors
-    be removed, but the JSON instance still fails to validate, recursively call
-    remove_jsonschema_errors until the instance validates or the recursion
-    depth limit is reached.
+    Remove fields in CSL Items that produce JSON Schema errors. The errors are
+    collected in a single validation pass into a set of element paths to delete.
+    Deletions are applied deepest path first, such that deleting an element does
+    not invalidate the paths of the remaining deletions. Should errors be removed,
+    but the JSON instance still fails to validate (e.g. when a deletion empties
+    an array that requires items), recursively call remove_jsonschema_errors
+    until the instance validates or the recursion depth limit is reached.
+    Each pass collects at most _max_jsonschema_errors errors, such that any
+    remaining errors are removed by the recursive calls.
 
     Note that this method may not be work for all types of JSON Schema errors
     and users looking to adapt it for other applications should write
     task-specific tests to provide empirical evaluate that it works as
     intended.
 
-    The default in_place=False creates a deepcopy of instance before pruning it,
-    such that a new dictionary is returned and instance is not edited.
-    Set in_place=True to edit instance in-place. The inital implementation of
-    remove_jsonschema_errors always deepcopied instance, and it is possible deepcopying
-    is important to prevent malfunction when encountering certain edge cases.
+    The default in_place=False does not edit instance. Instead, the containers
+    along the paths of errors are copied before pruning, such that the returned
+    object shares unmodified subtrees with instance. When instance has no errors,
+    it is returned as is. Set in_place=True to edit instance in-place.
+    The inital implementation of remove_jsonschema_errors always deepcopied instance.
     Please report if you observe any in_place dependent behaviors.
 
     See also:
     https://github.com/Julian/jsonschema/issues/448
     https://stackoverflow.com/questions/44694835
     """
+    if is_valid_csl(instance):
+        return instance
     validator = get_jsonschema_csl_validator()
-    errors = list(validator.iter_errors(instance))
+    deletions = dict()
+    errors = validator.iter_errors(instance)
+    for error in itertools.islice(errors, _max_jsonschema_errors):
+        _collect_deletions(error, deletions)
     if not in_place:
-        instance = copy.deepcopy(instance)
-    errors = sorted(errors, key=lambda e: e.path, reverse=True)
-    for error in errors:
-        _remove_error(instance, error)
-    if validator.is_valid(instance) or recurse_depth < 1:
+        instance = _copy_on_paths(instance, (path[:-1] for path in deletions))
+    path_cache = dict()
+    for path in sorted(deletions, key=lambda path: (len(path), path), reverse=True):
+        _delete_elem(instance, path, message=deletions[path], path_cache=path_cache)
+    if is_valid_csl(instance) or recurse_depth < 1:
         return instance
     return remove_jsonschema_errors(instance, recurse_depth - 1, in_place=in_place)
 
 
-def _delete_elem(instance, path, absolute_path=None, message=""):
-    """
-    Helper function for remove_jsonschema_errors that deletes an element in the
-    JSON-like input instance at the specified path. absolute_path is relative
-    to the original validated instance for logging purposes. Defaults to path,
-    if not specified. message is an optional string with additional error
-    information to log.
-    """
-    if absolute_path is None:
-        absolute_path = path
-    logging.debug(
-        (f"{message}\n" if message else message)
-        + "_delete_elem deleting CSL element at: "
-        + "/".join(map(str, absolute_path))
-    )
-    *head, tail = path
-    try:
-        del _deep_get(instance, head)[tail]
-    except KeyError:
-        pass
-
-
-def _deep_get(instance, path):
-    """
-    Descend path to return a deep element in the JSON object instance.
-    """
-    for key in path:
-        instance = instance[key]
-    return instance
-
-
-def _remove_error(instance, error):
+def _collect_deletions(error, deletions, parent_path=()):
     """
-    Remove a jsonschema ValidationError from the JSON-like instance.
+    Helper function for remove_jsonschema_errors that records the elements to
+    delete to remove a jsonschema ValidationError from its instance. deletions
+    is a dictionary updated in-place, whose keys are paths (tuples) relative to
+    the validated instance and values are messages to log upon deletion.
+    parent_path is the path of the instance validated by the parent of error,
+    for errors that are nested in the context of another error.
 
     See ValidationError documentation at
     https://python-jsonschema.readthedocs.io/en/latest/errors/#jsonschema.exceptions.ValidationError
     """
+    path = parent_path + tuple(error.path)
     sub_errors = error.context
     if sub_errors:
         # already_removed_additional was neccessary to workaround
@@ -110,8 +251,7 @@ def _remove_error(instance, error):
                 if already_removed_additional:
                     continue
                 already_removed_additional = True
-            sub_instance = _deep_get(instance, error.path)
-            _remove_error(sub_instance, sub_error)
+            _collect_deletions(sub_error, deletions, path)
     elif error.validator == "additionalProperties":
         extras = set(error.instance) - set(error.schema["properties"])
         logging.debug(
@@ -119,18 +259,81 @@ def _remove_error(instance, error):
             + f"\nWill now remove these {len(extras)} additional properties."
         )
         for key in extras:
-            _delete_elem(
-                instance=instance,
-                path=list(error.path) + [key],
-                absolute_path=list(error.absolute_path) + [key],
-            )
+            deletions.setdefault(path + (key,), "")
     elif error.validator in {"enum", "type", "minItems", "maxItems"}:
-        _delete_elem(instance, error.path, error.absolute_path, error.message)
+        deletions.setdefault(path, error.message)
     elif error.validator == "required":
         logging.warning(
             (f"{error.message}\n" if error.message else error.message)
             + "required element missing at: "
-            + "/".join(map(str, error.absolute_path))
+            + "/".join(map(str, path))
         )
     else:
         raise NotImplementedError(f"{error.validator} is not yet supported")
+
+
+def _copy_on_paths(instance, paths):
+    """
+    Helper function for remove_jsonschema_errors that returns a copy of the
+    JSON-like input instance, where only the containers along each path are
+    (shallow) copied. Subtrees that are not along any path are shared with
+    instance, such that deleting elements along a path in the returned copy
+    does not edit instance.
+    """
+    copies = {(): copy.copy(instance)}
+    for path in paths:
+        path = tuple(path)
+        node = copies[()]
+        for depth in range(1, len(path) + 1):
+            prefix = path[:depth]
+            if prefix not in copies:
+                key = prefix[-1]
+                try:
+                    child = node[key]
+                except (LookupError, TypeError):
+                    break
+                if not isinstance(child, (dict, list)):
+                    break
+                copies[prefix] = node[key] = copy.copy(child)
+            node = copies[prefix]
+    return copies[()]
+
+
+def _delete_elem(instance, path, message="", path_cache=None):
+    """
+    Helper function for remove_jsonschema_errors that deletes an element in the
+    JSON-like input instance at the specified path. message is an optional
+    string with additional error information to log. path_cache is an optional
+    dictionary passed to _deep_get, whose entries for paths within the deleted
+    element are removed.
+    """
+    logging.debug(
+        (f"{message}\n" if message else message)
+        + "_delete_elem deleting CSL element at: "
+        + "/".join(map(str, path))
+    )
+    *head, tail = path
+    try:
+        del _deep_get(instance, head, path_cache)[tail]
+    except LookupError:
+        pass
+    if path_cache:
+        path = tuple(path)
+        for key in [key for key in path_cache if key[: len(path)] == path]:
+            del path_cache[key]
+
+
+def _deep_get(instance, path, path_cache=None):
+    """
+    Descend path to return a deep element in the JSON object instance.
+    path_cache is an optional dictionary to memoize elements by path,
+    such that sibling elements do not each re-walk path from the root.
+    """
+    if path_cache is not None:
+        path = tuple(path)
+        if path not in path_cache:
+            path_cache[path] = _deep_get(instance, path)
+        return path_cache[path]
+    for key in path:
+        instance = instance[key]
+    return instance
@@ -23,13 +23,29 @@ The terminology we've adopted is csl_data for a list of csl_item dicts, and csl_
 for csl_data that is JSON-serialized.
 """
 
-import copy
 import datetime
 import logging
 import re
 from typing import Dict, List, Optional, Union
 
 from manubot.cite.citekey import CiteKey
+from manubot.util import copy_json
+
+from .citeproc import (
+    get_jsonschema_csl_validator,
+    is_valid_csl,
+    remove_jsonschema_errors,
+)
+
+"""
+Regexes for key-value pairs encoded in the note field using the CSL JSON "cheater syntax".
+Keys must conform to the variable_name syntax as per https://git.io/fjTzW.
+"""
+_note_key_pattern = re.compile(r"[A-Z]+|[-_a-z]+")
+_note_line_pattern = re.compile(
+    r"^(?P<key>[A-Z]+|[-_a-z]+): *(?P<value>.+?) *$", re.MULTILINE
+)
+_note_braced_pattern = re.compile(r"{:(?P<key>[A-Z]+|[-_a-z]+): *(?P<value>.+?) *}")
 
 
 class CSL_Item(dict):
@@ -79,8 +95,9 @@ class CSL_Item(dict):
         """
         if dictionary is None:
             dictionary = dict()
-        super().__init__(copy.deepcopy(dictionary))
-        self.update(copy.deepcopy(kwargs))
+        # dict() such that a CSL_Item input is copied by copy_json's fast path
+        super().__init__(copy_json(dict(dictionary)))
+        self.update(copy_json(kwargs))
 
     def set_id(self, id_) -> "CSL_Item":
         self["id"] = id_
@@ -111,8 +128,6 @@ class CSL_Item(dict):
         """
         Remove fields that violate the CSL Item JSON Schema.
         """
-        from .citeproc import remove_jsonschema_errors
-
         (csl_item,) = remove_jsonschema_errors([self], in_place=True)
         assert csl_item is self
         return self
@@ -122,8 +137,9 @@ class CSL_Item(dict):
         Confirm that the CSL_Item validates. If not, raises a
         jsonschema.exceptions.ValidationError.
         """
-        from .citeproc import get_jsonschema_csl_validator
-
+        if is_valid_csl([self]):
+            return self
+        # use jsonschema to raise an informative ValidationError
         validator = get_jsonschema_csl_validator()
         validator.validate([self])
         return self
@@ -137,12 +153,17 @@ class CSL_Item(dict):
         - set default value for "type" if missing, since CSL JSON requires type
         - validate against the CSL JSON schema (if prune=True) to ensure output
           CSL_Item is clean
+
+        When prune=True and the CSL_Item already validates after correcting its
+        type, pruning and the final validation are skipped.
         """
         logging.debug(
             f"Starting CSL_Item.clean with{'' if prune else 'out'}"
             f"CSL pruning for id: {self.get('id', 'id not specified')}"
         )
         self.correct_invalid_type()
+        if prune and "type" in self and is_valid_csl([self]):
+            return self
         if prune:
             self.prune_against_schema()
         self.set_default_type()
@@ -206,12 +227,8 @@ class CSL_Item(dict):
         Assigning to this dict will not update `self["note"]`.
         """
         note = self.note
-        line_matches = re.findall(
-            r"^(?P<key>[A-Z]+|[-_a-z]+): *(?P<value>.+?) *$", note, re.MULTILINE
-        )
-        braced_matches = re.findall(
-            r"{:(?P<key>[A-Z]+|[-_a-z]+): *(?P<value>.+?) *}", note
-        )
+        line_matches = _note_line_pattern.findall(note)
+        braced_matches = _note_braced_pattern.findall(note)
         return dict(line_matches + braced_matches)
 
     def note_append_text(self, text: str) -> None:
@@ -238,7 +255,7 @@ class CSL_Item(dict):
         to encode additional values not defined by the CSL JSON schema.
         """
         for key, value in dictionary.items():
-            if not re.fullmatch(r"[A-Z]+|[-_a-z]+", key):
+            if not _note_key_pattern.fullmatch(key):
                 logging.warning(
                     f"note_append_dict: skipping adding {key!r} because "
                     f"it does not conform to the variable_name syntax as per https://git.io/fjTzW."
@@ -297,7 +314,8 @@ class CSL_Item(dict):
                 add_to_note["original_standard_id"] = original_standard_id
         if standard_id != note_dict.get("standard_id"):
             add_to_note["standard_id"] = standard_id
-        self.note_append_dict(dictionary=add_to_note)
+        if add_to_note:
+            self.note_append_dict(dictionary=add_to_note)
         self.set_id(standard_id)
         return self
 
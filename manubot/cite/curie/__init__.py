@@ -171,9 +171,8 @@ def standardize_curie(curie):
         raise TypeError(
             f"curie parameter should be string. Received {curie.__class__.__name__} instead for {curie}"
         )
-    try:
-        prefix, accession = curie.split(":", 1)
-    except ValueError:
+    prefix, sep, accession = curie.partition(":")
+    if not sep:
         raise ValueError(
             f"curie must be splittable by `:` and formatted like `prefix:accession`. Received {curie}"
         )
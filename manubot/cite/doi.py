@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 import urllib.parse
 import urllib.request
 from typing import Any, Callable, Optional
@@ -19,8 +20,8 @@ class Handler_DOI(Handler):
         "doi",
         "shortdoi",
     ]
-    accession_pattern = r"10\.[0-9]{4,9}/\S+"
-    shortdoi_pattern = r"10/[a-zA-Z0-9]+"
+    accession_pattern = re.compile(r"10\.[0-9]{4,9}/\S+")
+    shortdoi_pattern = re.compile(r"10/[a-zA-Z0-9]+")
 
     def inspect(self, citekey):
         identifier = citekey.accession
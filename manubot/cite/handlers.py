@@ -41,18 +41,39 @@ A citekey prefix is inferred from the first matching pattern in this list.
 """
 
 
+@functools.lru_cache(maxsize=5_000)
 def infer_prefix(dealiased_id: str) -> Optional[str]:
     """
     Infer the prefix for citekey by matching it against a sequence of regexes.
     If a match is found, return the coressponding standard prefix.
     Otherwise, return None.
     """
-    for prefix, pattern_attrib in _infer_prefix_patterns:
+    regex, group_to_prefix = _get_infer_prefix_regex()
+    match = regex.fullmatch(dealiased_id)
+    if not match:
+        return None
+    return group_to_prefix[match.lastgroup]
+
+
+@functools.lru_cache()
+def _get_infer_prefix_regex() -> Tuple[Pattern, Dict[str, str]]:
+    """
+    Return a regex that combines the patterns in `_infer_prefix_patterns` into
+    a single alternation with a named group per pattern, and a dictionary from
+    group name to standard prefix. Alternatives are tried in order, such that
+    fullmatch matches the first pattern that matches the entire string.
+    Pattern flags are not preserved, so patterns should use inline flags if needed.
+    Computed on first use to avoid importing handler modules until needed.
+    """
+    alternatives = list()
+    group_to_prefix = dict()
+    for i, (prefix, pattern_attrib) in enumerate(_infer_prefix_patterns):
         handler = get_handler(prefix)
         pattern = handler._get_pattern(attribute=pattern_attrib)
-        if pattern.fullmatch(dealiased_id):
-            return handler.standard_prefix
-    return None
+        group = f"infer_prefix_{i}"
+        alternatives.append(f"(?P<{group}>{pattern.pattern})")
+        group_to_prefix[group] = handler.standard_prefix
+    return re.compile("|".join(alternatives)), group_to_prefix
 
 
 @functools.lru_cache(maxsize=10_000)
@@ -105,8 +126,11 @@ class Handler:
         Return a compiled regex pattern stored by `attribute`.
         By default, return `self.accession_pattern`, which Handler subclasses
         can set to provide the expected pattern for `self.accession`.
+        Handler subclasses should set patterns as compiled regexes, such that
+        compilation occurs once. Patterns set as strings, such as for CURIE
+        handlers whose patterns are loaded at runtime, are compiled on each call
+        (subject to the `re` module's internal cache).
         """
-        # todo: consider caching compilation
         pattern = getattr(self, attribute, None)
         if not pattern:
             return None
@@ -2,6 +2,8 @@ import json
 import logging
 import re
 
+import isbnlib
+
 from .handlers import Handler
 
 
@@ -14,16 +16,12 @@ class Handler_ISBN(Handler):
     ]
 
     def inspect(self, citekey):
-        import isbnlib
-
         fail = isbnlib.notisbn(citekey.accession, level="strict")
         if fail:
             return f"identifier violates the ISBN syntax according to isbnlib v{isbnlib.__version__}"
 
     def standardize_prefix_accession(self, accession):
-        from isbnlib import to_isbn13
-
-        accession = to_isbn13(accession)
+        accession = isbnlib.to_isbn13(accession)
         return self.standard_prefix, accession
 
     def get_csl_item(self, citekey):
@@ -39,8 +37,6 @@ def get_isbn_csl_item(isbn: str):
     in order, with this function returning the metadata from the first
     non-failing method.
     """
-    import isbnlib
-
     isbn = isbnlib.to_isbn13(isbn)
     for retriever in isbn_retrievers:
         try:
@@ -129,8 +125,6 @@ def get_isbn_csl_item_isbnlib(isbn: str):
     """
     Generate CSL JSON Data for an ISBN using isbnlib.
     """
-    import isbnlib
-
     metadata = isbnlib.meta(isbn)
     csl_json = isbnlib.registry.bibformatters["csl"](metadata)
     csl_data = json.loads(csl_json)
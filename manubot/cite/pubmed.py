@@ -1,7 +1,10 @@
+import contextlib
 import functools
 import json
 import logging
 import os
+import re
+import threading
 import warnings
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from xml.etree import ElementTree
@@ -22,7 +25,7 @@ class Handler_PubMed(Handler):
         "pubmed",
         "pmid",
     ]
-    accession_pattern = r"[1-9][0-9]{0,7}"
+    accession_pattern = re.compile(r"[1-9][0-9]{0,7}")
 
     def inspect(self, citekey: CiteKey) -> Optional[str]:
         identifier = citekey.accession
@@ -46,7 +49,7 @@ class Handler_PMC(Handler):
         "pmc",
         "pmcid",
     ]
-    accession_pattern = r"PMC[0-9]+"
+    accession_pattern = re.compile(r"PMC[0-9]+")
 
     def inspect(self, citekey: CiteKey) -> Optional[str]:
         identifier = citekey.accession
@@ -133,7 +136,7 @@ def get_pubmed_csl_item(pmid: Union[str, int]) -> Dict[str, Any]:
     params = {"db": "pubmed", "id": pmid, "rettype": "full"}
     headers = {"User-Agent": get_manubot_user_agent()}
     url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-    with _get_eutils_rate_limiter():
+    with _eutils_rate_limit():
         response = requests.get(url, params, headers=headers)
     try:
         xml_article_set = ElementTree.fromstring(response.text)
@@ -332,7 +335,7 @@ def get_pmid_for_doi(doi: str) -> Optional[str]:
     params = {"db": "pubmed", "term": f"{doi}[DOI]"}
     headers = {"User-Agent": get_manubot_user_agent()}
     url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-    with _get_eutils_rate_limiter():
+    with _eutils_rate_limit():
         response = requests.get(url, params, headers=headers)
     if not response.ok:
         logging.warning(f"Status code {response.status_code} querying {response.url}\n")
@@ -377,6 +380,23 @@ if TYPE_CHECKING:
     from ratelimiter import RateLimiter
 
 
+"""
+Lock to serialize NCBI E-utilities queries across threads. RateLimiter records
+calls as they exit, so concurrent queries would otherwise all pass its check.
+"""
+_eutils_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _eutils_rate_limit():
+    """
+    Context manager for NCBI E-utilities queries that are both rate limited
+    and serialized, such that it is safe to query from multiple threads.
+    """
+    with _eutils_lock, _get_eutils_rate_limiter():
+        yield
+
+
 @functools.lru_cache()
 def _get_eutils_rate_limiter() -> "RateLimiter":
     """
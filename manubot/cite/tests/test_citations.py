@@ -103,3 +103,14 @@ def test_citations_csl_serialization(csl_format):
     # citations.write_csl_items(path_out)
     csl_out = getattr(citations, f"csl_{csl_format}")
     assert csl_out == path_out.read_text()
+
+
+def test_citations_get_csl_items_preserves_order():
+    """
+    CSL Items are generated concurrently, but should be returned in input order.
+    """
+    input_ids = [f"doi:10.1000/{i}" for i in range(25, 0, -1)]
+    manual_refs = {x: {"id": x, "type": "entry"} for x in input_ids}
+    citations = Citations(input_ids, manual_refs=manual_refs, sort_csl_items=False)
+    csl_items = citations.get_csl_items()
+    assert [csl_item["id"] for csl_item in csl_items] == input_ids
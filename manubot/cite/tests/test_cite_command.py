@@ -4,7 +4,9 @@ import shutil
 import subprocess
 
 import pytest
+import yaml
 
+from manubot.cite.cite_command import _iter_metadata_block, call_pandoc
 from manubot.cite.csl_item import CSL_Item
 from manubot.pandoc.util import get_pandoc_version
 from manubot.util import shlex_join
@@ -69,6 +71,41 @@ def test_cite_command_stdout():
     assert csl["URL"] == "https://arxiv.org/abs/1806.05726v1"
 
 
+def test_iter_metadata_block():
+    metadata = {
+        "nocite": "@*",
+        "csl": None,
+        "references": [
+            {"id": "a", "title": "Ünïcode: “quotes”\n- and # yaml syntax"},
+            {
+                "id": "b",
+                "author": [{"family": "Doe"}],
+                "issued": {"date-parts": [[2020]]},
+            },
+        ],
+        "empty": [],
+    }
+    text = b"".join(_iter_metadata_block(metadata)).decode()
+    assert text.startswith("---\n")
+    assert text.endswith("\n...\n")
+    assert yaml.safe_load(text[: -len("...\n")].lstrip("-")) == metadata
+
+
+@pytest.mark.skipif(
+    not shutil.which("pandoc"), reason="pandoc installation not found on system"
+)
+def test_call_pandoc_serialization_error(tmp_path):
+    """
+    When the metadata block fails to serialize partway, pandoc should be
+    stopped rather than render the truncated input.
+    """
+    path = tmp_path / "references.txt"
+    metadata = {"nocite": "@*", "references": [{"id": "a"}, object()]}
+    with pytest.raises(TypeError):
+        call_pandoc(metadata, path)
+    assert not path.exists()
+
+
 def test_cite_command_file(tmpdir):
     path = pathlib.Path(tmpdir) / "csl-items.json"
     process = subprocess.run(
@@ -193,6 +193,29 @@ def test_inspect_citekey_fails(citekey, contains):
     assert contains in report
 
 
+def test_inspect_citekey_cached(monkeypatch):
+    from manubot.cite.doi import Handler_DOI
+
+    calls = list()
+
+    def inspect(self, citekey):
+        calls.append(citekey.input_id)
+        return "issue"
+
+    monkeypatch.setattr(Handler_DOI, "inspect", inspect)
+    citekey = CiteKey("doi:10.7717/peerj.705")
+    assert citekey.inspect() == "issue"
+    assert citekey.inspect() == "issue"
+    assert calls == ["doi:10.7717/peerj.705"]
+
+
+@pytest.mark.parametrize("input_id", ["DOI-typo:10.7717/peerj.705", "no-prefix"])
+def test_inspect_citekey_unhandled_prefix(input_id):
+    citekey = CiteKey(input_id)
+    assert citekey.inspect() is None
+    assert "handler" not in citekey.__dict__
+
+
 @pytest.mark.parametrize(
     ["url", "citekey"],
     [
@@ -3,7 +3,14 @@ import pathlib
 
 import pytest
 
-from manubot.cite.citeproc import remove_jsonschema_errors
+from manubot.cite.citeproc import (
+    _copy_on_paths,
+    _deep_get,
+    _delete_elem,
+    _inline_local_refs,
+    _locked,
+    remove_jsonschema_errors,
+)
 
 directory = pathlib.Path(__file__).parent
 csl_instances = [x.name for x in directory.glob("csl-json/*-csl")]
@@ -41,3 +48,162 @@ def test_remove_jsonschema_errors(name):
     expected = load_json(data_dir / "pruned.json")
     pruned = remove_jsonschema_errors(raw)
     assert pruned == expected
+
+
+@pytest.mark.parametrize("name", csl_instances)
+def test_remove_jsonschema_errors_does_not_edit_input(name):
+    data_dir = directory / "csl-json" / name
+    raw = load_json(data_dir / "raw.json")
+    remove_jsonschema_errors(raw)
+    assert raw == load_json(data_dir / "raw.json")
+
+
+def test_copy_on_paths():
+    instance = [{"author": [{"family": "Doe", "extra": 1}], "title": {"a": "b"}}]
+    copied = _copy_on_paths(instance, [[0, "author", 0, "extra"]])
+    assert copied == instance
+    assert copied is not instance
+    assert copied[0] is not instance[0]
+    assert copied[0]["author"][0] is not instance[0]["author"][0]
+    # subtrees off the path are shared
+    assert copied[0]["title"] is instance[0]["title"]
+    del copied[0]["author"][0]["extra"]
+    assert instance[0]["author"][0] == {"family": "Doe", "extra": 1}
+
+
+def test_copy_on_paths_missing_path():
+    instance = [{"title": "x"}]
+    copied = _copy_on_paths(instance, [[0, "author", 0], [3]])
+    assert copied == instance
+    assert copied[0] is not instance[0]
+
+
+def test_deep_get_path_cache():
+    instance = {"author": [{"family": "Doe"}, {"family": "Roe"}]}
+    path_cache = dict()
+    assert _deep_get(instance, ["author", 1], path_cache) == {"family": "Roe"}
+    assert ("author", 1) in path_cache
+    _delete_elem(instance, ["author", 1], path_cache=path_cache)
+    assert ("author", 1) not in path_cache
+    _delete_elem(instance, ["author", 0, "family"], path_cache=path_cache)
+    assert instance == {"author": [{}]}
+
+
+def test_read_cached_schema(tmp_path, monkeypatch):
+    import manubot.cite.citeproc
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    schema = {"type": "array", "items": {"$ref": "#/definitions/item"}}
+    url = "https://example.org/schema.json"
+    monkeypatch.setattr(manubot.cite.citeproc, "read_serialized_data", lambda _: schema)
+    assert manubot.cite.citeproc._read_cached_schema(url) == schema
+    (cache_path,) = tmp_path.joinpath("manubot", "schemas").iterdir()
+    assert json.loads(cache_path.read_text()) == schema
+    # cached schema must be read without network access
+    monkeypatch.setattr(manubot.cite.citeproc, "read_serialized_data", None)
+    assert manubot.cite.citeproc._read_cached_schema(url) == schema
+
+
+def test_read_cached_schema_outdated(tmp_path, monkeypatch):
+    import os
+
+    import manubot.cite.citeproc
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    url = "https://example.org/schema.json"
+    old_schema, new_schema = {"type": "array"}, {"type": "object"}
+    monkeypatch.setattr(
+        manubot.cite.citeproc, "read_serialized_data", lambda _: old_schema
+    )
+    manubot.cite.citeproc._read_cached_schema(url)
+    (cache_path,) = tmp_path.joinpath("manubot", "schemas").iterdir()
+    max_age = manubot.cite.citeproc._schema_cache_max_age
+    mtime = cache_path.stat().st_mtime - max_age - 1
+    os.utime(cache_path, (mtime, mtime))
+
+    # outdated cached schema is used when the download fails
+    def read_serialized_data(url):
+        raise OSError("offline")
+
+    monkeypatch.setattr(
+        manubot.cite.citeproc, "read_serialized_data", read_serialized_data
+    )
+    assert manubot.cite.citeproc._read_cached_schema(url) == old_schema
+    # outdated cached schema is replaced when the download succeeds
+    monkeypatch.setattr(
+        manubot.cite.citeproc, "read_serialized_data", lambda _: new_schema
+    )
+    assert manubot.cite.citeproc._read_cached_schema(url) == new_schema
+    assert json.loads(cache_path.read_text()) == new_schema
+
+
+def test_read_cached_schema_without_cache_directory(monkeypatch):
+    import manubot.cite.citeproc
+
+    schema = {"type": "array"}
+    monkeypatch.setattr(manubot.cite.citeproc, "get_cache_directory", lambda: None)
+    monkeypatch.setattr(manubot.cite.citeproc, "read_serialized_data", lambda _: schema)
+    assert manubot.cite.citeproc._read_cached_schema("https://example.org") == schema
+
+
+def test_remove_jsonschema_errors_max_errors(monkeypatch):
+    """
+    Errors beyond _max_jsonschema_errors should be removed by recursive calls.
+    """
+    import manubot.cite.citeproc
+
+    monkeypatch.setattr(manubot.cite.citeproc, "_max_jsonschema_errors", 2)
+    csl_items = [
+        {"id": f"item-{i}", "type": "article", "invalid-field": i} for i in range(5)
+    ]
+    pruned = remove_jsonschema_errors(csl_items)
+    assert pruned == [{"id": f"item-{i}", "type": "article"} for i in range(5)]
+
+
+def test_inline_local_refs():
+    schema = {
+        "type": "array",
+        "items": {"$ref": "#/definitions/item"},
+        "definitions": {
+            "item": {
+                "properties": {
+                    "issued": {"$ref": "#/definitions/date"},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/item"},
+                    },
+                }
+            },
+            "date": {"type": "string"},
+        },
+    }
+    inlined = _inline_local_refs(schema)
+    item = inlined["items"]
+    assert item["properties"]["issued"] == {"type": "string"}
+    # recursive reference is not inlined
+    assert item["properties"]["children"]["items"] == {"$ref": "#/definitions/item"}
+    # input schema is not modified
+    assert schema["items"] == {"$ref": "#/definitions/item"}
+
+
+def test_locked_lru_cache_builds_once():
+    """
+    Concurrent calls to a cold cache should build the cached value once.
+    """
+    import concurrent.futures
+    import functools
+    import time
+
+    calls = list()
+
+    @_locked
+    @functools.lru_cache()
+    def build():
+        calls.append(None)
+        time.sleep(0.05)
+        return object()
+
+    with concurrent.futures.ThreadPoolExecutor(10) as executor:
+        results = list(executor.map(lambda _: build(), range(10)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
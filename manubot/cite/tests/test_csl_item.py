@@ -38,6 +38,18 @@ class Test_CSL_Item:
         assert ci == {"a": 1, "b": 2}
         assert dict1 == {"a": 1}
 
+    def test_constructor_orjson_conversions(self):
+        """
+        When orjson is installed, CSL_Item copies tuples as lists
+        and non-finite floats as None.
+        """
+        from manubot.util import _import_orjson
+
+        if _import_orjson() is None:
+            pytest.skip("orjson not installed")
+        csl_item = CSL_Item({"issued": {"date-parts": ((2020, 1),)}}, nan=float("nan"))
+        assert csl_item == {"issued": {"date-parts": [[2020, 1]]}, "nan": None}
+
     def test_correct_invalid_type(self):
         assert CSL_Item(type="journal-article").correct_invalid_type() == {
             "type": "article-journal"
@@ -61,6 +73,15 @@ class Test_CSL_Item:
         csl_item.clean(prune=True)
         assert csl_item == {"type": "chapter", "id": "abc"}
 
+    def test_clean_valid_item_skips_pruning(self, monkeypatch):
+        def prune_against_schema(self):
+            raise AssertionError("valid CSL_Item should not be pruned")
+
+        monkeypatch.setattr(CSL_Item, "prune_against_schema", prune_against_schema)
+        csl_item = CSL_Item(type="chapter", id="abc")
+        csl_item.clean(prune=True)
+        assert csl_item == {"type": "chapter", "id": "abc"}
+
 
 def test_assert_csl_item_type_passes():
     assert_csl_item_type(CSL_Item())
@@ -1,3 +1,4 @@
+import re
 from typing import Any, Dict
 
 from .handlers import Handler
@@ -6,7 +7,7 @@ from .handlers import Handler
 class Handler_Wikidata(Handler):
     prefixes = ["wikidata"]
     standard_prefix = "wikidata"
-    accession_pattern = r"Q[0-9]+"
+    accession_pattern = re.compile(r"Q[0-9]+")
 
     def inspect(self, citekey):
         """
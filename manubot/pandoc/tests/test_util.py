@@ -1,4 +1,11 @@
-from manubot.pandoc.util import get_pandoc_version
+import json
+import subprocess
+import sys
+
+import pytest
+
+import manubot.pandoc.util
+from manubot.pandoc.util import get_command_version, get_pandoc_version
 
 
 def test_get_pandoc_version():
@@ -7,3 +14,51 @@ def test_get_pandoc_version():
     assert len(version) >= 2
     for v in version:
         assert isinstance(v, int)
+
+
+def test_get_command_version_cache(tmp_path, monkeypatch):
+    """
+    Use the Python executable, whose `--version` output resembles pandoc's,
+    to test that versions are cached on disk.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    version = get_command_version(sys.executable)
+    assert version == tuple(sys.version_info[:3])
+    cache = json.loads(tmp_path.joinpath("manubot", "pandoc_info.json").read_text())
+    assert cache[sys.executable]["version"] == list(version)
+    # cached version is returned without running a subprocess
+    monkeypatch.setattr(manubot.pandoc.util, "subprocess", None)
+    assert get_command_version(sys.executable) == version
+
+
+def test_get_command_version_without_cache_directory(monkeypatch):
+    monkeypatch.setattr(manubot.pandoc.util, "get_cache_directory", lambda: None)
+    assert get_command_version(sys.executable) == tuple(sys.version_info[:3])
+
+
+def _write_script(path, body):
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX shell")
+def test_get_command_version_nonzero_exit(tmp_path):
+    """
+    A command that fails should raise rather than have its version cached.
+    """
+    path = _write_script(tmp_path / "tool", 'echo "tool 1.2.3"; exit 3')
+    with pytest.raises(subprocess.CalledProcessError):
+        get_command_version(path)
+    cache_path = manubot.pandoc.util.get_cache_directory() / "pandoc_info.json"
+    assert path not in manubot.pandoc.util._read_version_cache(cache_path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX shell")
+def test_get_command_version_sigpipe(tmp_path):
+    """
+    A command terminated by SIGPIPE, since only the first line of its output
+    is read, should not raise.
+    """
+    path = _write_script(tmp_path / "tool", 'echo "tool 1.2.3"; exec yes')
+    assert get_command_version(path) == (1, 2, 3)
@@ -1,9 +1,21 @@
 import functools
+import json
 import logging
+import os
+import re
 import shutil
+import signal
 import subprocess
 from typing import Any, Dict, Tuple
 
+from manubot.util import get_cache_directory
+
+"""
+Regex matching the version number in the first line of `--version` output,
+for example `pandoc 2.11.4` or `pandoc-citeproc 0.17.0.1`.
+"""
+_version_pattern = re.compile(r"^\S+\s+v?(?P<version>\d+(?:\.\d+)*)")
+
 
 @functools.lru_cache()
 def get_pandoc_info() -> Dict[str, Any]:
@@ -66,14 +78,62 @@ def get_command_info(command: str) -> dict:
     if not path:
         return command_info_dict
 
-    version = subprocess.check_output(args=[command, "--version"], encoding="utf-8")
-    logging.debug(version)
-    version, *_discard = version.splitlines()
-    _discard, version = version.strip().split()
-    from packaging.version import parse as parse_version
-
-    version = parse_version(version).release
+    version = get_command_version(path)
     command_info_dict[f"{command} version"] = version
     command_info_dict[f"{command} path"] = path
 
     return command_info_dict
+
+
+def get_command_version(path: str) -> Tuple[int, ...]:
+    """
+    Return the version of the executable at `path` as reported by `--version`.
+    Versions are cached on disk by executable path and modification time,
+    such that subsequent invocations do not need to spawn a subprocess.
+    """
+    cache_directory = get_cache_directory()
+    cache_path = (
+        cache_directory.joinpath("pandoc_info.json") if cache_directory else None
+    )
+    cache = _read_version_cache(cache_path) if cache_path else {}
+    mtime = os.stat(path).st_mtime_ns
+    entry = cache.get(path)
+    if isinstance(entry, dict) and entry.get("mtime") == mtime:
+        return tuple(entry["version"])
+
+    # only the first line of output is needed, so do not read the remainder
+    args = [path, "--version"]
+    with subprocess.Popen(args, stdout=subprocess.PIPE, encoding="utf-8") as process:
+        first_line = process.stdout.readline()
+    logging.debug(first_line)
+    # closing stdout early can terminate the command with SIGPIPE (POSIX only)
+    sigpipe = getattr(signal, "SIGPIPE", None)
+    if process.returncode and not (sigpipe and process.returncode == -sigpipe):
+        raise subprocess.CalledProcessError(process.returncode, args, first_line)
+    match = _version_pattern.match(first_line.strip())
+    if not match:
+        raise ValueError(
+            f"could not parse version from `{path} --version` output: {first_line!r}"
+        )
+    version = tuple(map(int, match.group("version").split(".")))
+    if not cache_path:
+        return version
+    cache[path] = {"mtime": mtime, "version": version}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as error:
+        logging.info(f"get_command_version: could not write {cache_path}:\n{error}")
+    return version
+
+
+def _read_version_cache(path) -> dict:
+    """
+    Read the on-disk cache of command versions written by get_command_version.
+    Return an empty dictionary if the cache is missing or unreadable.
+    """
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
@@ -4,7 +4,7 @@ import os
 import pathlib
 
 from manubot.cite.citekey import shorten_citekey
-from manubot.util import read_serialized_data
+from manubot.util import is_http_url, read_serialized_data
 
 
 def load_bibliography(path: str) -> list:
@@ -37,7 +37,7 @@ def load_bibliography(path: str) -> list:
         csl_items = []
     from manubot.cite.csl_item import CSL_Item
 
-    csl_items = [CSL_Item(csl_item) for csl_item in csl_items]
+    csl_items = list(map(CSL_Item, csl_items))
     return csl_items
 
 
@@ -55,9 +55,13 @@ def load_manual_references(paths=[], extra_csl_items=[]) -> dict:
     from manubot.cite.csl_item import CSL_Item
 
     csl_items = []
-    paths = list(dict.fromkeys(paths))  # remove duplicates
+    # remove duplicates, including local paths that refer to the same file
+    unique_paths = dict()
     for path in paths:
         path = os.fspath(path)
+        key = path if is_http_url(path) else pathlib.Path(path).resolve()
+        unique_paths.setdefault(key, path)
+    for path in unique_paths.values():
         path_obj = pathlib.Path(path)
         bibliography = load_bibliography(path)
         for csl_item in bibliography:
@@ -72,11 +76,13 @@ def load_manual_references(paths=[], extra_csl_items=[]) -> dict:
         try:
             csl_item.standardize_id()
         except Exception:
-            csl_item_str = json.dumps(csl_item, indent=2)
-            logging.info(
-                f"Skipping csl_item where setting standard_id failed:\n{csl_item_str}",
-                exc_info=True,
-            )
+            # only serialize csl_item when the log record would be emitted
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                csl_item_str = json.dumps(csl_item, indent=2)
+                logging.info(
+                    f"Skipping csl_item where setting standard_id failed:\n{csl_item_str}",
+                    exc_info=True,
+                )
             continue
         standard_id = csl_item["id"]
         csl_item.set_id(shorten_citekey(standard_id))
@@ -51,21 +51,25 @@ def get_thumbnail_url(thumbnail=None):
     return _thumbnail_path_to_url(thumbnail)
 
 
+@functools.lru_cache()
 def _find_thumbnail_path():
     """
     If this this function is executed with a working directory that is inside a git repository,
     return the path to a `thumbnail.png` file located anywhere in that repository. Otherwise,
-    return `None`.
+    return `None`. When multiple thumbnails exist, prefer the least nested path.
+    The conventional locations (the repository root or one directory below, such as
+    `content/thumbnail.png`) are checked before recursively searching the repository.
     """
     directory = git_repository_root()
     if not directory:
         return None
-    paths = directory.glob("**/thumbnail.png")
-    paths = [path.relative_to(directory) for path in paths]
-    paths = sorted(paths, key=lambda x: (len(x.parents), x))
-    if not paths:
-        return None
-    return paths[0].as_posix()
+    for pattern in "thumbnail.png", "*/thumbnail.png", "**/thumbnail.png":
+        paths = directory.glob(pattern)
+        paths = [path.relative_to(directory) for path in paths]
+        paths = sorted(paths, key=lambda x: (len(x.parents), x))
+        if paths:
+            return paths[0].as_posix()
+    return None
 
 
 def _thumbnail_path_to_url(path):
@@ -89,17 +93,39 @@ def _thumbnail_path_to_url(path):
 def git_repository_root():
     """
     Return the path to repository root directory or `None` if indeterminate.
+    For a submodule, return the working tree root of its superproject.
+    The repository is located by searching the working directory and its
+    parents for `.git`, rather than running `git rev-parse` subprocesses.
+    """
+    cwd = pathlib.Path.cwd().resolve()
+    for directory in (cwd, *cwd.parents):
+        dot_git = directory.joinpath(".git")
+        if dot_git.is_dir():
+            return directory
+        if dot_git.is_file():
+            return _git_superproject_root(dot_git) or directory
+    return None
+
+
+def _git_superproject_root(dot_git: pathlib.Path) -> Optional[pathlib.Path]:
+    """
+    Git uses a `.git` file rather than directory for submodules and worktrees,
+    which contains the path to the repository's git directory. Submodule git
+    directories reside in the `.git/modules` directory of the superproject.
+    Given the path to a `.git` file, return the working tree root of the
+    outermost superproject or `None` if the repository is not a submodule.
     """
-    for cmd in (
-        ["git", "rev-parse", "--show-superproject-working-tree"],
-        ["git", "rev-parse", "--show-toplevel"],
-    ):
-        try:
-            path = subprocess.check_output(cmd, universal_newlines=True).rstrip("\r\n")
-            if path:
-                return pathlib.Path(path)
-        except (subprocess.CalledProcessError, OSError):
-            pass
+    try:
+        text = dot_git.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    gitdir = dot_git.parent.joinpath(text[len("gitdir:") :].strip()).resolve()
+    parts = gitdir.parts
+    for i in range(1, len(parts) - 1):
+        if parts[i : i + 2] == (".git", "modules"):
+            return pathlib.Path(*parts[:i])
     return None
 
 
@@ -1,3 +1,6 @@
+import pytest
+
+import manubot.process.bibliography
 from manubot.pandoc.tests.test_bibliography import (
     directory,
     skipif_no_pandoc,
@@ -45,3 +48,42 @@ class Test_load_manual_references:
         assert csl_item_3["author"][0]["family"] == "Beaulieu-Jones"
         assert "source_bibliography: bibliography.nbib" in csl_item_3["note"]
         assert "standard_id: Beaulieu-Jones2017" in csl_item_3["note"]
+
+
+def test_load_manual_references_deduplicates_paths(tmp_path, monkeypatch):
+    """
+    Paths that refer to the same file should only be loaded once.
+    """
+    tmp_path.joinpath("refs.json").write_text("[]")
+    loaded_paths = list()
+
+    def load_bibliography(path):
+        loaded_paths.append(path)
+        return []
+
+    monkeypatch.setattr(
+        manubot.process.bibliography, "load_bibliography", load_bibliography
+    )
+    monkeypatch.chdir(tmp_path)
+    paths = ["refs.json", "./refs.json", tmp_path / "refs.json", "other.json"]
+    load_manual_references(paths)
+    assert loaded_paths == ["refs.json", "other.json"]
+
+
+@pytest.mark.parametrize("level", ["INFO", "WARNING"])
+def test_load_manual_references_standardize_id_failure(caplog, monkeypatch, level):
+    """
+    CSL Items that fail standardize_id are skipped,
+    which is logged when INFO messages are emitted.
+    """
+    from manubot.cite.csl_item import CSL_Item
+
+    def standardize_id(self):
+        raise ValueError("cannot standardize")
+
+    monkeypatch.setattr(CSL_Item, "standardize_id", standardize_id)
+    caplog.set_level(level)
+    manual_refs = load_manual_references([], extra_csl_items=[{"id": "raw:a"}])
+    assert manual_refs == {}
+    assert ("standard_id failed" in caplog.text) == (level == "INFO")
+    assert ('"id": "raw:a"' in caplog.text) == (level == "INFO")
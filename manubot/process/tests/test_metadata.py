@@ -2,8 +2,14 @@ import copy
 
 import pytest
 
+from .. import metadata
 from ..ci import get_continuous_integration_parameters
-from ..metadata import get_header_includes, get_manuscript_urls, get_thumbnail_url
+from ..metadata import (
+    get_header_includes,
+    get_manuscript_urls,
+    get_thumbnail_url,
+    git_repository_root,
+)
 
 
 def test_get_header_includes_description_abstract():
@@ -126,3 +132,55 @@ def test_get_thumbnail_url(thumbnail, expected):
 def test_get_manuscript_urls(html_url, expected):
     urls = get_manuscript_urls(html_url)
     assert urls == expected
+
+
+@pytest.mark.parametrize(
+    "cwd, expected",
+    [
+        ("", ""),
+        ("content/images", ""),
+        ("worktree/content", "worktree"),
+        ("submodule/content", ""),
+    ],
+)
+def test_git_repository_root(tmp_path, monkeypatch, cwd, expected):
+    tmp_path = tmp_path.resolve()
+    tmp_path.joinpath(".git", "modules", "submodule").mkdir(parents=True)
+    tmp_path.joinpath("content", "images").mkdir(parents=True)
+    tmp_path.joinpath("worktree", "content").mkdir(parents=True)
+    tmp_path.joinpath("worktree", ".git").write_text(
+        f"gitdir: {tmp_path.joinpath('.git', 'worktrees', 'worktree')}\n"
+    )
+    tmp_path.joinpath("submodule", "content").mkdir(parents=True)
+    tmp_path.joinpath("submodule", ".git").write_text(
+        "gitdir: ../.git/modules/submodule\n"
+    )
+    monkeypatch.chdir(tmp_path.joinpath(cwd))
+    git_repository_root.cache_clear()
+    try:
+        assert git_repository_root() == tmp_path.joinpath(expected)
+    finally:
+        git_repository_root.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "paths, expected",
+    [
+        ([], None),
+        (["thumbnail.png", "content/thumbnail.png"], "thumbnail.png"),
+        (["content/thumbnail.png", "a/b/thumbnail.png"], "content/thumbnail.png"),
+        (["content/thumbnail.png", "build/thumbnail.png"], "build/thumbnail.png"),
+        (["a/b/thumbnail.png", "a/c/d/thumbnail.png"], "a/b/thumbnail.png"),
+    ],
+)
+def test_find_thumbnail_path(tmp_path, monkeypatch, paths, expected):
+    for path in paths:
+        path = tmp_path.joinpath(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    monkeypatch.setattr(metadata, "git_repository_root", lambda: tmp_path)
+    metadata._find_thumbnail_path.cache_clear()
+    try:
+        assert metadata._find_thumbnail_path() == expected
+    finally:
+        metadata._find_thumbnail_path.cache_clear()
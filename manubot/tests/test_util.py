@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 import manubot.util
@@ -37,3 +39,85 @@ def test_read_serialized_dict_url_toml():
     url = raw_repo_url + "pyproject.toml"
     obj = manubot.util.read_serialized_dict(url)
     assert "black" in obj["tool"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("indent", [True, False])
+def test_serialize_json(monkeypatch, use_orjson, indent):
+    import json
+
+    if not use_orjson:
+        monkeypatch.setattr(manubot.util, "_import_orjson", lambda: None)
+    elif manubot.util._import_orjson() is None:
+        pytest.skip("orjson not installed")
+    obj = [{"title": "Ünïcode “quotes”\nand\tescapes", "issued": [[2020, 1]]}, {}]
+    output = manubot.util.serialize_json(obj, indent=indent)
+    assert isinstance(output, bytes)
+    expected = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    )
+    assert output.decode() == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_copy_json(monkeypatch, use_orjson):
+    import datetime
+
+    if not use_orjson:
+        monkeypatch.setattr(manubot.util, "_import_orjson", lambda: None)
+    elif manubot.util._import_orjson() is None:
+        pytest.skip("orjson not installed")
+    obj = {"title": "Ünïcode", "author": [{"family": "Doe"}], "issued": 2.5}
+    copied = manubot.util.copy_json(obj)
+    assert copied == obj
+    assert copied["author"][0] is not obj["author"][0]
+    # dates are preserved rather than serialized as strings
+    obj = {"issued": datetime.date(2020, 1, 31), 1: "non-str key"}
+    assert manubot.util.copy_json(obj) == obj
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_copy_json_lossy_conversions(monkeypatch, use_orjson):
+    """
+    copy_json with orjson copies tuples as lists and non-finite floats as None,
+    whereas the copy.deepcopy fallback preserves them.
+    """
+    if not use_orjson:
+        monkeypatch.setattr(manubot.util, "_import_orjson", lambda: None)
+    elif manubot.util._import_orjson() is None:
+        pytest.skip("orjson not installed")
+    obj = {"date-parts": ((2020, 1),), "nan": float("nan"), "inf": float("inf")}
+    copied = manubot.util.copy_json(obj)
+    if use_orjson:
+        assert copied == {"date-parts": [[2020, 1]], "nan": None, "inf": None}
+    else:
+        assert copied["date-parts"] == ((2020, 1),)
+        assert copied["nan"] != copied["nan"]
+        assert copied["inf"] == float("inf")
+
+
+def test_import_orjson_missing_options(monkeypatch):
+    """
+    Outdated orjson versions without the required options are not used.
+    """
+    import types
+
+    monkeypatch.setitem(sys.modules, "orjson", types.ModuleType("orjson"))
+    assert manubot.util._import_orjson.__wrapped__() is None
+
+
+def test_get_cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert manubot.util.get_cache_directory() == tmp_path.joinpath("manubot")
+
+
+def test_get_cache_directory_without_home(monkeypatch):
+    def home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(manubot.util.pathlib.Path, "home", home)
+    assert manubot.util.get_cache_directory() is None
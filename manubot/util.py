@@ -1,3 +1,5 @@
+import copy
+import functools
 import importlib
 import json
 import logging
@@ -46,6 +48,27 @@ def get_manubot_user_agent() -> str:
     )
 
 
+def get_cache_directory() -> typing.Optional[pathlib.Path]:
+    """
+    Return the directory where Manubot persists cached data across invocations.
+    Follows the XDG Base Directory Specification, such that the directory is
+    `$XDG_CACHE_HOME/manubot` if XDG_CACHE_HOME is set or `~/.cache/manubot` otherwise.
+    The directory is not created by this function.
+    Returns None if XDG_CACHE_HOME is not set and the home directory cannot be
+    determined (e.g. for a user without a passwd entry or HOME), in which case
+    callers should not cache data on disk.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = pathlib.Path.home() / ".cache"
+        except (KeyError, RuntimeError) as error:
+            # KeyError before Python 3.10, RuntimeError afterwards
+            logging.info(f"get_cache_directory: home directory not found:\n{error}")
+            return None
+    return pathlib.Path(cache_home).joinpath("manubot")
+
+
 def shlex_join(split_command) -> str:
     """
     Backport shlex.join for Python < 3.8.
@@ -113,6 +136,86 @@ def read_serialized_data(path: str):
     return json.loads(text)
 
 
+def serialize_json(obj, indent: bool = True) -> bytes:
+    """
+    Serialize obj as UTF-8 encoded JSON, without escaping non-ASCII characters.
+    Set indent=True to indent by 2 spaces or indent=False for compact output.
+    Uses orjson if installed, which is many times faster than the json module.
+    Falls back to the json module, including for objects orjson cannot serialize
+    like dictionaries with non-str keys. Outputs are identical except for
+    uncommon values like non-finite floats.
+    """
+    orjson = _import_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    json_str = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    )
+    return json_str.encode()
+
+
+def copy_json(obj):
+    """
+    Return a deep copy of obj, a JSON-like data structure. Uses an orjson
+    serialization round-trip when orjson is installed, which is several times
+    faster than copy.deepcopy. Falls back to copy.deepcopy for objects that
+    orjson would not round-trip, such as dates, subclasses of builtin types,
+    and dictionaries with non-str keys. When orjson is used, tuples are copied
+    as lists and non-finite floats as None.
+    """
+    orjson = _import_orjson()
+    if orjson is not None:
+        option = (
+            orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        try:
+            return orjson.loads(orjson.dumps(obj, option=option))
+        except TypeError:
+            pass
+    return copy.deepcopy(obj)
+
+
+"""
+orjson options used by serialize_json and copy_json,
+which older orjson versions do not provide.
+"""
+_orjson_options: typing.Tuple[str, ...] = (
+    "OPT_INDENT_2",
+    "OPT_PASSTHROUGH_DATACLASS",
+    "OPT_PASSTHROUGH_DATETIME",
+    "OPT_PASSTHROUGH_SUBCLASS",
+)
+
+
+@functools.lru_cache()
+def _import_orjson() -> typing.Optional[ModuleType]:
+    """
+    Lazily import orjson, an optional dependency, returning None if not installed
+    or if the installed version is too old to provide `_orjson_options`.
+    Avoids importing orjson for commands that do not serialize JSON.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    missing = [x for x in _orjson_options if not hasattr(orjson, x)]
+    if missing:
+        logging.info(
+            f"Not using orjson {getattr(orjson, '__version__', '')}, "
+            f"which is missing {', '.join(missing)}. Please upgrade orjson."
+        )
+        return None
+    return orjson
+
+
 """
 yamllint configuration as per https://yamllint.readthedocs.io/en/stable/configuration.html
 """